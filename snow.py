@@ -4,6 +4,10 @@ This module provides functions for loading and analyzing Finnish Meteorological
 A special focus is given to "White Christmas" analysis, for which several classification and
 plotting functions are included.
 
+All analysis and plotting functions operate in the dataset's native CRS (ETRS-TM35FIN,
+EPSG:3067); only vector borders are reprojected onto it. If a differently projected map is
+needed, reproject the final aggregated raster once instead of warping every year raster.
+
 Dataset can be dowloaded from Paituli:
     https://paituli.csc.fi/download.html?data_id=il_daily_snow_10km_geotiff_euref
 
@@ -12,29 +16,73 @@ International License (CC BY 4.0)
 """
 __author__ = "Marcelo Mouta"
 
+import os
+import pickle
+import concurrent.futures
+from pathlib import Path
+
 import snow_utils as utils
+import rasterio
+import rasterio.shutil
 import rioxarray as rxr
 import numpy as np
+import pandas as pd
+import xarray as xr
 import matplotlib.pyplot as plt
 from rasterio.errors import RasterioIOError
 
+# blosc2 is an optional dependency, only needed for cached raster loading
+try:
+    import blosc2
+except ImportError:
+    blosc2 = None
+
+# Tune GDAL for faster raster reads: skip the directory scan on open and
+# give the block cache some room (values are respected only if not already set)
+os.environ.setdefault("GDAL_DISABLE_READDIR_ON_OPEN", "EMPTY_DIR")
+os.environ.setdefault("GDAL_CACHEMAX", "512")
+
+# Cache file reads at the VSI layer as well, so re-opening the same rasters
+# (e.g. when producing several maps) skips the syscall and header-parse cost
+os.environ.setdefault("VSI_CACHE", "TRUE")
+os.environ.setdefault("VSI_CACHE_SIZE", str(256 * 1024 * 1024))
+
+# Keep PROJ from looking up transformation grids over the network
+os.environ.setdefault("PROJ_NETWORK", "OFF")
+
+# Band slice selecting the Christmas days (24-26.12) of a full-year raster,
+# counted from the end so it works for both regular and leap years
+XMAS_BANDS = slice(-8, -5)
+
 
-def open_snow_year_raster(raster_dir, year):
+def open_snow_year_raster(raster_dir, year, chunks=None, quantize=False):
     """
     Open FMI snow depth raster of given year
-    
+
     Args:
         raster_dir (str | Path): path where snow depth rasters are located
         year: raster year
-    
+        chunks (dict, optional): chunk sizes passed to rioxarray for lazy, dask-backed
+            loading (e.g. {"x": 1024, "y": 1024}). Defaults to None (load in memory).
+        quantize (bool, optional): If True, quantize snow depths to int16 centimeters
+            to halve memory traffic (loads the raster in memory). Defaults to False.
+
     Returns:
         DataArray: raster with snow depth for given year
     """
     # Get raster filename from dir and year
     raster_file = raster_dir /  f"snow_{year}.tif"
 
-    # Load raster
-    year_raster = rxr.open_rasterio(raster_file, masked=True)
+    if quantize:
+        # Skip rioxarray's NaN masking pass over the full array: read the raw
+        # values and fold the nodata sentinel directly into the quantized raster
+        year_raster = rxr.open_rasterio(raster_file, masked=False, mask_and_scale=False,
+                                        NUM_THREADS="ALL_CPUS")
+        year_raster.rio.write_crs("EPSG:3067", inplace=True)
+        return utils.quantize_snow(year_raster, nodata=year_raster.rio.nodata)
+
+    # Load raster, letting GDAL decode tiles with all available cores
+    year_raster = rxr.open_rasterio(raster_file, masked=True, chunks=chunks, NUM_THREADS="ALL_CPUS")
 
     # CRS should be in ETRS-TM35FIN (EPSG:3067)
     year_raster.rio.write_crs("EPSG:3067", inplace=True)
@@ -42,7 +90,196 @@ def open_snow_year_raster(raster_dir, year):
     return year_raster
 
 
-def open_snow_rasters(raster_dir, start_year=1961, end_year=2022, missing_data=False):
+def open_snow_year_raster_cached(raster_dir, year, cache_dir):
+    """
+    Open FMI snow depth raster of given year, caching the decoded array on disk
+
+    The first load decodes the GeoTIFF and stores its values in cache_dir as a
+    compressed blosc2 array (plus a small sidecar file with the raster metadata).
+    Subsequent loads decompress at near-memcpy speed instead of going through
+    libtiff again. Requires the optional blosc2 package.
+
+    Args:
+        raster_dir (str | Path): path where snow depth rasters are located
+        year: raster year
+        cache_dir (str | Path): directory where decoded rasters are cached
+
+    Returns:
+        DataArray: raster with snow depth for given year
+    """
+    if blosc2 is None:
+        raise ImportError("the blosc2 package is required for cached raster loading")
+
+    cache_dir = Path(cache_dir)
+    cache_file = cache_dir / f"snow_{year}.b2nd"
+    meta_file = cache_dir / f"snow_{year}.meta.pkl"
+
+    # Cache hit: decompress the stored values and rebuild the DataArray around them
+    if cache_file.exists() and meta_file.exists():
+        vals = blosc2.open(str(cache_file))[:]
+        with open(meta_file, "rb") as f:
+            meta = pickle.load(f)
+
+        year_raster = xr.DataArray(vals, dims=meta["dims"], coords=meta["coords"], attrs=meta["attrs"])
+        year_raster.rio.write_crs("EPSG:3067", inplace=True)
+        return year_raster
+
+    # Cache miss: decode the GeoTIFF once and store its values compressed
+    year_raster = open_snow_year_raster(raster_dir, year).load()
+    vals = year_raster.values
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    blosc2.asarray(
+        np.ascontiguousarray(vals),
+        urlpath=str(cache_file),
+        mode="w",
+        chunks=(1, min(512, vals.shape[1]), min(512, vals.shape[2])),
+        cparams={"codec": blosc2.Codec.ZSTD, "clevel": 3}
+    )
+    # pickle the coords as plain arrays: pickling the DataArrayCoordinates object
+    # would drag the raster's full pixel data into the sidecar file
+    coords = {name: np.asarray(coord) for name, coord in year_raster.coords.items()}
+    with open(meta_file, "wb") as f:
+        pickle.dump({"dims": year_raster.dims, "coords": coords, "attrs": year_raster.attrs}, f)
+
+    return year_raster
+
+
+def to_cog(src_file, dst_file):
+    """
+    Convert a GeoTIFF to a Cloud-Optimized GeoTIFF (COG)
+
+    The Paituli GeoTIFFs are strip-based, so reading just the 3 Christmas bands
+    still decompresses whole strips. A one-time conversion to the tiled COG
+    layout lets open_xmas_slab touch only the tiles of those bands, and enables
+    cheap HTTP range reads if the data is hosted remotely.
+
+    Args:
+        src_file (str | Path): path of the GeoTIFF to convert
+        dst_file (str | Path): path where the COG will be written
+    """
+    rasterio.shutil.copy(src_file, dst_file, driver="COG", compress="DEFLATE", blocksize=512)
+
+
+def open_xmas_slab(raster_dir, year, quantize=False):
+    """
+    Open only the Christmas days (24-26.12) of the FMI snow raster of given year
+
+    The Christmas analysis only ever touches 3 of the ~365 daily bands, so
+    reading just those windows cuts the decoded data volume roughly 120x.
+
+    Args:
+        raster_dir (str | Path): path where snow depth rasters are located
+        year: raster year
+        quantize (bool, optional): If True, quantize snow depths to int16 centimeters,
+            see open_snow_year_raster. Defaults to False.
+
+    Returns:
+        DataArray: raster with snow depth for 24-26.12 of given year
+    """
+    # Get raster filename from dir and year
+    raster_file = raster_dir /  f"snow_{year}.tif"
+
+    with rasterio.open(raster_file, NUM_THREADS="ALL_CPUS") as src:
+        # 1-based band numbers of the Christmas days (24-26.12)
+        band_count = src.count
+        xmas_band_indexes = [band_count - 7, band_count - 6, band_count - 5]
+
+        if quantize:
+            vals = src.read(xmas_band_indexes)
+        else:
+            # mask the nodata sentinel to NaN, as rioxarray's masked loading does
+            vals = src.read(xmas_band_indexes, masked=True).astype(np.float32).filled(np.nan)
+
+        nodata = src.nodata
+        transform = src.transform
+
+        # pixel-center spatial coordinates of the grid
+        xs = transform.c + (np.arange(src.width) + 0.5) * transform.a
+        ys = transform.f + (np.arange(src.height) + 0.5) * transform.e
+
+    slab = xr.DataArray(
+        vals,
+        dims=("band", "y", "x"),
+        coords={"band": xmas_band_indexes, "y": ys, "x": xs}
+    )
+
+    # CRS should be in ETRS-TM35FIN (EPSG:3067)
+    slab.rio.write_crs("EPSG:3067", inplace=True)
+
+    if quantize:
+        return utils.quantize_snow(slab, nodata=nodata)
+
+    return slab
+
+
+def _open_rasters_parallel(open_year, year_interval, missing_data):
+    """
+    Open one raster per year concurrently, collecting the results keyed by year
+
+    Args:
+        open_year (Callable[[int], DataArray]): function opening the raster of one year
+        year_interval (range): years to open
+        missing_data (bool): If True, omits IO errors when raster files are missing
+
+    Returns:
+        dict[int, DataArray]: dictionary keyed by year with the opened rasters as values
+    """
+    rasters = {}
+
+    # Open rasters concurrently: GDAL releases the GIL so threads overlap the I/O
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(year_interval))) as executor:
+        futures = {year: executor.submit(open_year, year) for year in year_interval}
+
+        # collect in submission order, so the returned dict is keyed by ascending year
+        for year, future in futures.items():
+            try:
+                rasters[year] = future.result()
+
+            except RasterioIOError as e:
+                # If data is not expected to be missing, print IO error
+                if not missing_data:
+                    print(e)
+
+    return rasters
+
+
+def open_xmas_slabs(raster_dir, start_year=1961, end_year=2022, missing_data=False, quantize=False):
+    """
+    Return dictionary with the Christmas days (24-26.12) of all snow rasters in given interval
+
+    Drop-in replacement for open_snow_rasters when only the Christmas analysis is
+    needed: every downstream classification accepts these 3-band slabs directly.
+
+    Args:
+        raster_dir (str | Path): path for the snow depth rasters
+        start_year (int, optional): Start year of the interval, minimum is 1961. Defaults to 1961.
+        end_year (int, optional): End year of the interval. Defaults to 2022.
+        missing_data (bool): If True, omits IO errors when raster files are missing. Defaults to False.
+        quantize (bool, optional): If True, quantize snow depths to int16 centimeters,
+            see open_snow_year_raster. Defaults to False.
+
+    Returns:
+        dict[int, DataArray]: dictionary keyed by year with Christmas snow depth slabs as values
+
+    Raises:
+        ValueError: If start_year and end_year do not form a valid interval within 1961-2022
+    """
+    # check if given interval is valid
+    utils.check_year_interval(start_year, end_year)
+
+    # year interval for which snow data will be retrieved
+    year_interval = range(start_year, end_year+1)
+
+    return _open_rasters_parallel(
+        lambda year: open_xmas_slab(raster_dir, year, quantize),
+        year_interval,
+        missing_data
+    )
+
+
+def open_snow_rasters(raster_dir, start_year=1961, end_year=2022, missing_data=False, chunks=None,
+                      cache_dir=None, quantize=False, xmas_only=False):
     """
     Return dictionary with all snow depth rasters in given year interval
 
@@ -51,6 +288,15 @@ def open_snow_rasters(raster_dir, start_year=1961, end_year=2022, missing_data=F
         start_year (int, optional): Start year of the interval, minimum is 1961. Defaults to 1961.
         end_year (int, optional): End year of the interval. Defaults to 2022.
         missing_data (bool): If True, omits IO errors when raster files are missing. Defaults to False.
+        chunks (dict, optional): chunk sizes for lazy, dask-backed loading.
+            Defaults to None (load in memory).
+        cache_dir (str | Path, optional): directory for the blosc2 raster cache, see
+            open_snow_year_raster_cached. Takes precedence over chunks. Defaults to None.
+        quantize (bool, optional): If True, quantize snow depths to int16 centimeters,
+            see open_snow_year_raster. Defaults to False.
+        xmas_only (bool, optional): If True, read only the 3 Christmas bands of each
+            raster, see open_xmas_slab. Takes precedence over chunks and cache_dir.
+            Defaults to False.
 
     Returns:
         dict[int, DataArray]: dictionary keyed by year with snow depth rasters as values
@@ -64,19 +310,46 @@ def open_snow_rasters(raster_dir, start_year=1961, end_year=2022, missing_data=F
     # year interval for which snow data will be retrieved
     year_interval = range(start_year, end_year+1)
 
-    # dict of snow rasters keyed by year
-    snow_rasters = {}
+    if xmas_only:
+        open_year = lambda year: open_xmas_slab(raster_dir, year, quantize)
+    elif cache_dir is not None:
+        open_year = lambda year: open_snow_year_raster_cached(raster_dir, year, cache_dir)
+    else:
+        open_year = lambda year: open_snow_year_raster(raster_dir, year, chunks, quantize)
+
+    return _open_rasters_parallel(open_year, year_interval, missing_data)
+
+
+def _xmas_bands(year_raster):
+    """
+    Select the 3 Christmas days (24-26.12) of given raster
+
+    Accepts both full-year rasters and the 3-band slabs of open_xmas_slab.
+    """
+    if year_raster.sizes.get("band") == 3:
+        return year_raster
+
+    return year_raster.isel(band=XMAS_BANDS)
+
+
+def _average_days(vals, axis):
+    """
+    Average snow depth values over the Christmas days axis, preserving missing data
+
+    Args:
+        vals (ndarray): snow depth values with the 3 Christmas days along the given axis
+        axis (int): axis holding the 3 Christmas days
 
-    for year in year_interval:
-        try:
-            snow_rasters[year] = open_snow_year_raster(raster_dir, year)
-        
-        except RasterioIOError as e:
-            # If data is not expected to be missing, print IO error
-            if not missing_data:
-                print(e)
+    Returns:
+        ndarray: average snow depth, with NaN (float) or SNOW_NODATA (int) for missing pixels
+    """
+    if np.issubdtype(vals.dtype, np.integer):
+        # quantized snow depths: accumulate in int32 and keep the nodata sentinel
+        averages = (vals.astype(np.int32).sum(axis=axis) // 3).astype(np.int16)
+        return np.where(utils.invalid_mask(vals).any(axis=axis), utils.SNOW_NODATA, averages)
 
-    return snow_rasters
+    # average snow depth over christmas days (NaN marks missing data)
+    return vals.mean(axis=axis, dtype=np.float32)
 
 
 def average_xmas_snow(year_raster):
@@ -89,14 +362,23 @@ def average_xmas_snow(year_raster):
     Returns:
         DataArray: raster with average snow depth from 24-26 of december of given year 
     """
-    # Get rasters for Christmas days (24-26) December
-    xmas_eve = year_raster.isel(band=-8) # day 24.12
-    xmas_day = year_raster.isel(band=-7) # day 25.12
-    boxing_day = year_raster.isel(band=-6) # day 26.12
+    # Get the Christmas days (24-26.12) as a single (3, y, x) slab
+    xmas_days = _xmas_bands(year_raster)
+
+    # For dask-backed rasters keep the average lazy
+    if year_raster.chunks is not None:
+        return xmas_days.mean(dim="band", skipna=False)
 
-    # average snow depth over christmas days
-    xmas_average = (xmas_eve + xmas_day + boxing_day) / 3
-    return xmas_average
+    xmas_average = _average_days(xmas_days.values, axis=0)
+
+    # Convert to an xarray DataArray reusing the year raster's spatial metadata
+    first_raster = xmas_days.isel(band=1).drop_vars("band")
+    return xr.DataArray(
+        xmas_average,
+        dims=first_raster.dims,
+        coords=first_raster.coords,
+        attrs=first_raster.attrs
+    )
 
 
 def avg_xmas_snow_rasters(snow_rasters):
@@ -109,13 +391,60 @@ def avg_xmas_snow_rasters(snow_rasters):
     Returns:
         dict[int, DataArray]: dictionary keyed by year with average of 24.-26.12 snow depth rasters as values.
     """
-    # dict of avg snow rasters keyed by year
-    avg_xmas_snow = dict()
+    years = list(snow_rasters.keys())
 
-    for year in snow_rasters.keys():
-        avg_xmas_snow[year] = average_xmas_snow(snow_rasters[year])
-    
-    return avg_xmas_snow
+    # nothing to average (e.g. no raster files matched with missing_data=True)
+    if not years:
+        return {}
+
+    first_raster = snow_rasters[years[0]]
+
+    # For dask-backed rasters keep the averages lazy, one graph per year
+    if first_raster.chunks is not None:
+        return {year: average_xmas_snow(snow_rasters[year]) for year in years}
+
+    # Stack the Christmas days (24-26.12) of all years into one (years, 3, y, x) array
+    # and average them in a single vectorized reduction
+    stacked = np.stack([_xmas_bands(snow_rasters[year]).values for year in years], axis=0)
+    averages = _average_days(stacked, axis=1)
+
+    # Rebuild the per-year DataArrays reusing the first year's spatial metadata
+    first_raster = _xmas_bands(first_raster).isel(band=1).drop_vars("band")
+
+    return {
+        year: xr.DataArray(
+            averages[i],
+            dims=first_raster.dims,
+            coords=first_raster.coords,
+            attrs=first_raster.attrs
+        )
+        for i, year in enumerate(years)
+    }
+
+
+def build_xmas_avg_cube(snow_rasters):
+    """
+    Build a single (year, y, x) DataArray with average Christmas snow depth per year
+
+    Alternative to avg_xmas_snow_rasters for pipelines preferring one labelled cube
+    over a per-year dictionary: white_avg_xmas_sum reduces it directly along the
+    year dimension. Expects masked (float, NaN for missing data) snow rasters.
+
+    Args:
+        snow_rasters (dict[int, DataArray]): dictionary keyed by year with snow depth rasters as values
+
+    Returns:
+        DataArray: average Christmas (24.-26.12) snow depth with a year dimension
+    """
+    # sort the years so the cube's year coordinate is monotonic and label slicing works
+    years = sorted(snow_rasters)
+
+    # Concatenate the Christmas days of all years and average them in one reduction
+    xmas_days = xr.concat(
+        [_xmas_bands(snow_rasters[year]).drop_vars("band") for year in years],
+        dim=pd.Index(years, name="year")
+    )
+    return xmas_days.mean(dim="band", skipna=False)
 
 
 def classify_white_day(snow_day_raster, snow_threshold=1):
@@ -134,16 +463,39 @@ def classify_white_day(snow_day_raster, snow_threshold=1):
     if snow_threshold <= 0:
         raise ValueError("snow_threshold must be bigger than 0")
 
-    # Define 2 bins: no-snow and white day
-    bins = [0, snow_threshold, np.inf]
+    # Reclassify the raster into the 2 snow categories with a single comparison
+    return utils.reclassify_white_day(snow_day_raster, snow_threshold)
 
-    # Reclassify the raster with 2 snow categories
-    reclassified = utils.reclassify_raster(snow_day_raster, bins)
 
-    # change classification values from [1,2] to [0,1]
-    reclassified -= 1
-    
-    return reclassified
+# Fraction of white pixels on the first day below which the sparse path is used
+_SPARSE_WHITE_FRACTION = 0.3
+
+
+def _all_white_mask(vals, snow_threshold):
+    """
+    Mask of pixels where all 3 Christmas days pass the snow threshold
+
+    When few pixels of the first day are white, the remaining days are only
+    evaluated on those pixels instead of scanning the full rasters again.
+
+    Args:
+        vals (ndarray): snow depth values of the 3 Christmas days, shape (3, y, x)
+        snow_threshold: Snow depth threshold (in cm) for day to be considered white
+
+    Returns:
+        ndarray: uint8 mask with 1 where all 3 days are white
+    """
+    first_white = vals[0] >= snow_threshold
+
+    if first_white.sum() < _SPARSE_WHITE_FRACTION * first_white.size:
+        # Sparse case: restrict the remaining comparisons to the passing pixels
+        white_idx = np.flatnonzero(first_white.ravel())
+        all_white = np.zeros(first_white.size, dtype=np.uint8)
+        all_white[white_idx] = ((vals[1].ravel()[white_idx] >= snow_threshold)
+                                & (vals[2].ravel()[white_idx] >= snow_threshold))
+        return all_white.reshape(first_white.shape)
+
+    return (vals >= snow_threshold).all(axis=0).astype(np.uint8)
 
 
 def classify_all_white_xmas(year_raster, snow_threshold=1):
@@ -159,29 +511,155 @@ def classify_all_white_xmas(year_raster, snow_threshold=1):
         DataArray: Reclassified raster with class 1 for all white christmas and class 0 otherwise 
     """
 
-    xmas_days_indices = [-8, -7, -6] # indices for 24-26 December
+    if snow_threshold <= 0:
+        raise ValueError("snow_threshold must be bigger than 0")
+
+    # Get the Christmas days (24-26.12) as a single (3, y, x) slab
+    xmas_days = _xmas_bands(year_raster)
+
+    # For dask-backed rasters keep the classification lazy, applied chunk by chunk
+    if year_raster.chunks is not None:
+        all_white = (xmas_days >= snow_threshold).all(dim="band").astype(np.float32)
+        return all_white.where(xmas_days.notnull().all(dim="band"))
+
+    vals = xmas_days.values
+
+    # Christmas is white only when all 3 days pass the threshold
+    all_white = _all_white_mask(vals, snow_threshold)
+
+    # Retain NaN values for pixels missing data in any of the 3 days
+    all_white = np.where(utils.invalid_mask(vals).any(axis=0), np.nan, all_white)
+
+    # Convert to an xarray DataArray reusing the year raster's spatial metadata
+    first_raster = xmas_days.isel(band=1).drop_vars("band")
+    return xr.DataArray(
+        all_white,
+        dims=first_raster.dims,
+        coords=first_raster.coords,
+        attrs=first_raster.attrs
+    )
+
+
+# Stacked year cubes of the latest raster dictionaries, keyed by dictionary
+# identity (a strong reference to each dictionary is kept so ids stay valid)
+_MAX_CACHED_CUBES = 4
+_year_cube_cache = {}
+
+
+def _stack_years(rasters, start_year, end_year, cache=True):
+    """
+    Stack per-year rasters into a single contiguous array with years as the leading axis
+
+    The full stack over the dictionary's years is cached, so overlapping analysis
+    windows (e.g. the two periods of a side-by-side comparison) reuse the same
+    cube and only pay for the year slicing.
+
+    Args:
+        rasters (dict[int, DataArray]): dictionary keyed by year with rasters as values
+        start_year (int): Start year of the interval
+        end_year (int): End year of the interval
+        cache (bool, optional): If False, skip the cube cache — for internal
+            throwaway dictionaries that will never be looked up again. Defaults to True.
+
+    Returns:
+        ndarray: stacked raster values of shape (years, ...)
+
+    Raises:
+        KeyError: If any year of the interval is missing from the rasters
+    """
+    # every year of the window must be present: a silently shorter stack would
+    # corrupt the "N out of (end_year - start_year + 1)" sum semantics
+    for year in range(start_year, end_year+1):
+        if year not in rasters:
+            raise KeyError(year)
+
+    years = tuple(sorted(rasters.keys()))
+    source = tuple(rasters[year] for year in years)
+    cached = _year_cube_cache.get(id(rasters)) if cache else None
+
+    # the cached cube is only valid while the dict still holds the very same
+    # rasters it was stacked from (entries may have been replaced in place)
+    if (cached is not None and cached[0] is rasters and cached[1] == years
+            and all(raster is cached_raster for raster, cached_raster in zip(source, cached[2]))):
+        cube = cached[3]
+    else:
+        cube = np.stack([rasters[year].values for year in years], axis=0)
+
+        # Snow depths in cm fit comfortably in float32: halve the cube's memory
+        # traffic if float64 rasters were passed in
+        if cube.dtype == np.float64:
+            cube = cube.astype(np.float32)
+
+        if cache:
+            # keep the cache bounded, dropping the oldest entry
+            if len(_year_cube_cache) >= _MAX_CACHED_CUBES:
+                _year_cube_cache.pop(next(iter(_year_cube_cache)))
+            _year_cube_cache[id(rasters)] = (rasters, years, source, cube)
+
+    return cube[years.index(start_year):years.index(end_year)+1]
+
+
+def build_white_cumsum(avg_xmas_snow, snow_threshold=1):
+    """
+    Precompute cumulative white christmas counts over all years of given rasters
+
+    Intended for computing many (possibly overlapping) period sums: pass the
+    result to white_avg_xmas_sum's cumsum argument and any period's sum becomes
+    two slices and a subtraction, instead of a fresh pass over its years.
 
-    xmas_rasters = []
-    for i in xmas_days_indices:
-        xmas_day_raster = year_raster.isel(band=i)
-        white_xmas_day = classify_white_day(xmas_day_raster, snow_threshold)
-        xmas_rasters.append(white_xmas_day)
+    Args:
+        avg_xmas_snow (dict[int, DataArray]): dictionary keyed by year with average
+            christmas snow depth rasters as values
+        snow_threshold (int, optional): Snow depth threshold (in cm) for day to be considered white.
+            Defaults to 1.
 
-    return xmas_rasters[0] * xmas_rasters[1] * xmas_rasters[2]
+    Returns:
+        Dataset: cumulative counts of white christmas ("white") and of missing data
+            ("missing") per pixel, inclusive up to each year of the input rasters
+    """
+    if snow_threshold <= 0:
+        raise ValueError("snow_threshold must be bigger than 0")
+
+    years = sorted(avg_xmas_snow.keys())
+    cube = _stack_years(avg_xmas_snow, years[0], years[-1])
+
+    # Inclusive cumulative counts, prefixed with a zero plane so the sum of any
+    # window is cumsum[end_year] - cumsum[start_year - 1]
+    shape = (len(years) + 1,) + cube.shape[1:]
+    white = np.zeros(shape, dtype=np.int16)
+    missing = np.zeros(shape, dtype=np.int16)
+    np.cumsum(cube >= snow_threshold, axis=0, out=white[1:])
+    np.cumsum(utils.invalid_mask(cube), axis=0, out=missing[1:])
 
+    # Assemble the counts into a Dataset reusing the first year's raster metadata
+    first_raster = avg_xmas_snow[years[0]]
+    dims = ("year",) + first_raster.dims
+    coords = dict(first_raster.coords)
+    coords["year"] = [years[0] - 1] + years
 
-def white_avg_xmas_sum(avg_xmas_snow, start_year=1991, end_year=2020, snow_threshold=1):
+    return xr.Dataset(
+        {"white": (dims, white), "missing": (dims, missing)},
+        coords=coords,
+        attrs=first_raster.attrs
+    )
+
+
+def white_avg_xmas_sum(avg_xmas_snow, start_year=1991, end_year=2020, snow_threshold=1, cumsum=None):
     """
     Classify and sum white christmas occurrences over given year period.
     Christmas is classified as white if average snow depth
     of 3 christmas days (24-26) is bigger than given threshold.
 
     Args:
-        avg_xmas_snow (dict[int, DataArray]): dictionary keyed by year with average christmas snow depth rasters as values.
+        avg_xmas_snow (dict[int, DataArray] | DataArray): dictionary keyed by year with average
+            christmas snow depth rasters as values, or a (year, y, x) cube from build_xmas_avg_cube.
         start_year (int, optional): Start year of the interval, minimum is 1961. Defaults to 1991.
         end_year (int, optional): End year of the interval. Defaults to 2020.
         snow_threshold (int, optional): Snow depth threshold (in cm) for day to be considered white.
             Defaults to 1.
+        cumsum (Dataset, optional): precomputed cumulative counts from build_white_cumsum,
+            built with the same rasters and snow_threshold. When given, the period sum is
+            two slices and a subtraction. Defaults to None.
 
     Returns:
         DataArray: raster containing the sum of white christmas over given period
@@ -189,11 +667,61 @@ def white_avg_xmas_sum(avg_xmas_snow, start_year=1991, end_year=2020, snow_thres
     # check if given interval is valid
     utils.check_year_interval(start_year, end_year)
 
-    white_xmas_sum = classify_white_day(avg_xmas_snow[start_year], snow_threshold)
-    for year in range(start_year+1, end_year+1):
-       white_xmas_sum += classify_white_day(avg_xmas_snow[year], snow_threshold)
+    if snow_threshold <= 0:
+        raise ValueError("snow_threshold must be bigger than 0")
+
+    # With precomputed cumulative counts, the period's sum is the difference of
+    # the counts at its two endpoints
+    if cumsum is not None:
+        window = cumsum.sel(year=end_year) - cumsum.sel(year=start_year - 1)
+
+        # Retain NaN values for pixels missing data in any year
+        return window["white"].where(window["missing"] == 0)
+
+    # A (year, y, x) cube from build_xmas_avg_cube is reduced directly along its year dim
+    if isinstance(avg_xmas_snow, xr.DataArray):
+        # every year of the window must be present: label slicing would silently
+        # truncate the window and corrupt the "N out of M years" sum semantics
+        cube_years = set(avg_xmas_snow.year.values)
+        for year in range(start_year, end_year+1):
+            if year not in cube_years:
+                raise KeyError(year)
+
+        cube = avg_xmas_snow.sel(year=slice(start_year, end_year))
+        white_xmas_sum = (cube >= snow_threshold).sum(dim="year", dtype=np.int16)
+
+        # Retain NaN values for pixels missing data in any year
+        white_xmas_sum = white_xmas_sum.where(cube.notnull().all(dim="year"))
 
-    return white_xmas_sum
+        return white_xmas_sum.compute() if cube.chunks is not None else white_xmas_sum
+
+    first_raster = avg_xmas_snow[start_year]
+
+    # For dask-backed rasters, build one lazy graph and stream it chunk by chunk
+    if first_raster.chunks is not None:
+        stacked = xr.concat([avg_xmas_snow[year] for year in range(start_year, end_year+1)], dim="year")
+        white_xmas_sum = (stacked >= snow_threshold).sum(dim="year", dtype=np.int16)
+
+        # Retain NaN values for pixels missing data in any year
+        white_xmas_sum = white_xmas_sum.where(stacked.notnull().all(dim="year"))
+        return white_xmas_sum.compute()
+
+    # Stack all years into a single (years, y, x) array
+    stacked = _stack_years(avg_xmas_snow, start_year, end_year)
+
+    # Count white christmas years per pixel, streaming into a preallocated accumulator
+    counts, invalid = utils.cube_threshold_sum(stacked, snow_threshold)
+
+    # Retain NaN values for pixels missing data in any year
+    white_xmas_sum = np.where(invalid, np.nan, counts)
+
+    # Convert to an xarray DataArray reusing the first year's raster metadata
+    return xr.DataArray(
+        white_xmas_sum,
+        dims=first_raster.dims,
+        coords=first_raster.coords,
+        attrs=first_raster.attrs
+    )
     
 
 def all3_white_xmas_sum(snow_rasters, start_year=1991, end_year=2020, snow_threshold=1):
@@ -214,11 +742,41 @@ def all3_white_xmas_sum(snow_rasters, start_year=1991, end_year=2020, snow_thres
     # check if given interval is valid
     utils.check_year_interval(start_year, end_year)
 
-    white_xmas_sum = classify_all_white_xmas(snow_rasters[start_year], snow_threshold)
-    for year in range(start_year+1, end_year+1):
-       white_xmas_sum += classify_all_white_xmas(snow_rasters[year], snow_threshold)
+    if snow_threshold <= 0:
+        raise ValueError("snow_threshold must be bigger than 0")
+
+    # For dask-backed rasters, build one lazy graph and stream it chunk by chunk
+    if snow_rasters[start_year].chunks is not None:
+        stacked = xr.concat(
+            [_xmas_bands(snow_rasters[year]).drop_vars("band")
+             for year in range(start_year, end_year+1)],
+            dim="year"
+        )
+        white_xmas_sum = (stacked >= snow_threshold).all(dim="band").sum(dim="year", dtype=np.int16)
+
+        # Retain NaN values for pixels missing data in any day of any year
+        white_xmas_sum = white_xmas_sum.where(stacked.notnull().all(dim=("year", "band")))
+        return white_xmas_sum.compute()
+
+    # Stack the Christmas days (24-26.12) of all years into a single (years, 3, y, x) array
+    # (no caching: the slabs dict is rebuilt per call, so it would never be looked up again)
+    xmas_rasters = {year: _xmas_bands(raster) for year, raster in snow_rasters.items()}
+    stacked = _stack_years(xmas_rasters, start_year, end_year, cache=False)
+
+    # Christmas is white only when all 3 days pass the threshold; count those years per pixel
+    counts, invalid = utils.cube_all3_threshold_sum(stacked, snow_threshold)
 
-    return white_xmas_sum
+    # Retain NaN values for pixels missing data in any day of any year
+    white_xmas_sum = np.where(invalid, np.nan, counts)
+
+    # Convert to an xarray DataArray reusing the first year's raster metadata
+    first_raster = _xmas_bands(snow_rasters[start_year]).isel(band=1).drop_vars("band")
+    return xr.DataArray(
+        white_xmas_sum,
+        dims=first_raster.dims,
+        coords=first_raster.coords,
+        attrs=first_raster.attrs
+    )
 
 
 def classify_prob_white_xmas(xmas_sum_raster):
@@ -240,6 +798,10 @@ def classify_prob_white_xmas(xmas_sum_raster):
     return utils.reclassify_raster(xmas_sum_raster, bins)
 
 
+# Colormap for the white christmas classification maps, built once at import
+_SNOW_CMAP = plt.matplotlib.colors.ListedColormap(['dimgray', 'lightblue'])
+
+
 def plot_white_xmas(raster, year, snow_threshold=1, borders=None):
     """
     Plot White Christmas map given reclassified raster for that year
@@ -251,13 +813,10 @@ def plot_white_xmas(raster, year, snow_threshold=1, borders=None):
             Defaults to 1.
         borders (GeoDataFrame, optional): Borders vector data to plot. Defaults to None.
     """
-    # create custom cmap
-    snow_cmap = plt.matplotlib.colors.ListedColormap(['dimgray', 'lightblue'])
-
     fig, ax = plt.subplots(figsize=(6, 6))
-    
-    # Plot using xarray's plot method
-    plot = raster.plot.imshow(ax=ax, cmap=snow_cmap, vmin=0, vmax=1)
+
+    # Plot using xarray's plot method, with the custom cmap
+    plot = raster.plot.imshow(ax=ax, cmap=_SNOW_CMAP, vmin=0, vmax=1)
 
     # If borders vector data is given, plot it too
     if borders is not None:
@@ -321,35 +880,28 @@ def plot_prob_wxmas_side_by_side(raster1, start_year1, end_year1, raster2, start
         end_year2 (int): End year of the second interval.
         borders (GeoDataFrame, optional): Borders vector data to plot. Defaults to None.
     """
-    # add 1 row with 2 subplots
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 6))
-    
     # use custom cmap
     custom_cmap = utils.wxmas_prob_cmap()
 
-    # plot subplot 1
-    plot1 = raster1.plot.imshow(ax=ax1, cmap=custom_cmap, vmin=1, vmax=6)
-    ax1.set_title(f"{start_year1}-{end_year1}")
+    # Stack both periods along a new dimension and plot them in one faceted call,
+    # which builds the 2 subplots with a single shared colorbar in one shot
+    # (instead of creating and then removing one colorbar per subplot)
+    periods = [f"{start_year1}-{end_year1}", f"{start_year2}-{end_year2}"]
+    stacked = xr.concat([raster1, raster2], dim=pd.Index(periods, name="period"))
+
+    facets = stacked.plot.imshow(col="period", cmap=custom_cmap, vmin=1, vmax=6, figsize=(10, 6))
 
-    # plot subplot 2
-    plot2 = raster2.plot.imshow(ax=ax2, cmap=custom_cmap, vmin=1, vmax=6)
-    ax2.set_title(f"{start_year2}-{end_year2}")
+    # title each subplot with its period, disabling all other axis, lines and ticks
+    for ax, period in zip(facets.axs.flat, periods):
+        ax.set_title(period)
+        ax.axis('off')
 
     # If borders vector data is given, plot it too
     if borders is not None:
-        utils.plot_borders(borders, raster1, [ax1, ax2])
+        utils.plot_borders(borders, raster1, facets.axs.flat)
 
-    # remove subplots colorbar and add one for the whole plot
-    plot1.colorbar.remove()
-    plot2.colorbar.remove()
-    cbar = fig.colorbar(plot2, ax=[ax1,ax2])
-    
     # Set only the classification ticks on the colorbar
-    utils.set_wxmas_prob_ticks(cbar)
-
-    # disable all other axis, lines and ticks
-    ax1.axis('off')
-    ax2.axis('off')
+    utils.set_wxmas_prob_ticks(facets.cbar)
 
     plt.suptitle("Probability of White Christmas over distinct time periods")
     plt.show()
@@ -7,6 +7,88 @@ import numpy as np
 import xarray as xr
 import matplotlib.pyplot as plt
 
+# numba is an optional dependency, used to speed up raster reclassification
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# numexpr is an optional dependency, used to speed up the cube reductions when numba is absent
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+
+if numba is not None:
+    @numba.guvectorize(
+        ["(float32[:], float64[:], float32[:])",
+         "(float64[:], float64[:], float64[:])"],
+        "(n),(m)->(n)",
+        nopython=True,
+        target="parallel"
+    )
+    def _digitize_numba(vals, bins, out):
+        """Fused digitize + NaN mask gufunc, binary searching the bin edges per pixel"""
+        for i in range(vals.size):
+            value = vals[i]
+            if np.isnan(value):
+                out[i] = np.nan
+            else:
+                # upper bound binary search: first bin edge bigger than the value
+                lo = 0
+                hi = bins.size
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if value >= bins[mid]:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                out[i] = lo
+
+    @numba.njit(parallel=True, cache=True)
+    def _threshold_sum_numba(cube, snow_threshold, counts, invalid):
+        """Fused compare-and-sum over the year axis with NaN tracking, one streaming pass"""
+        years, height, width = cube.shape
+        for i in numba.prange(height):
+            for j in range(width):
+                count = 0
+                missing = False
+                for y in range(years):
+                    value = cube[y, i, j]
+                    if np.isnan(value):
+                        missing = True
+                    elif value >= snow_threshold:
+                        count += 1
+                counts[i, j] = count
+                invalid[i, j] = missing
+
+    @numba.njit(parallel=True, cache=True)
+    def _all3_threshold_sum_numba(cube, snow_threshold, counts, invalid):
+        """Fused 3-day AND plus year count kernel with NaN tracking"""
+        years, days, height, width = cube.shape
+        for i in numba.prange(height):
+            for j in range(width):
+                count = 0
+                missing = False
+                for y in range(years):
+                    all_white = True
+                    for d in range(days):
+                        value = cube[y, d, i, j]
+                        if np.isnan(value):
+                            missing = True
+                            all_white = False
+                        elif value < snow_threshold:
+                            all_white = False
+                    if all_white:
+                        count += 1
+                counts[i, j] = count
+                invalid[i, j] = missing
+
+
+# Sentinel marking missing data in quantized (integer) snow rasters
+SNOW_NODATA = -1
+
 
 def check_year_interval(start_year, end_year):
     """
@@ -28,37 +110,227 @@ def get_tick_locations(ticks):
     return [start + diff/4, end - diff/4]
 
 
-def reclassify_raster(raster, bins):
-    """Reclassify raster according to given bins"""
-    
-    # Apply the reclassification
-    reclassified = np.digitize(raster, bins)
+def quantize_snow(raster, nodata=None):
+    """
+    Quantize a snow depth raster to int16 centimeters with a nodata sentinel
 
-    # Retain NaN values by ensuring they are not reclassified
-    reclassified = np.where(~np.isnan(raster), reclassified, np.nan)
+    Rounds the snow depths to whole centimeters, halving the memory traffic of
+    float arrays. Note that the dataset does contain fractional depths, so
+    classifications sitting exactly at a threshold boundary can differ slightly
+    from the float path — use the default float loading when exact agreement
+    matters. Missing data (NaN, or the given nodata value) is stored as the
+    SNOW_NODATA sentinel.
+
+    Args:
+        raster (DataArray): raster with snow depth cover
+        nodata (optional): nodata value of the raster. Defaults to None (NaN marks missing data).
+
+    Returns:
+        DataArray: int16 raster with snow depth in cm and SNOW_NODATA for missing pixels
+    """
+    vals = raster.values
+
+    # Round snow depths to whole centimeters, keeping missing data as the sentinel
+    # (a NaN nodata value only ever matches through the isnan test)
+    if nodata is None or np.isnan(nodata):
+        invalid = np.isnan(vals)
+    else:
+        invalid = vals == nodata
+    quantized = np.where(invalid, SNOW_NODATA, np.rint(vals)).astype(np.int16)
 
     # Convert to an xarray DataArray
-    reclassified = xr.DataArray(
-        reclassified,
+    quantized = xr.DataArray(
+        quantized,
         dims=raster.dims,  # Keep the same dimensions
         coords=raster.coords,  # Retain the spatial coordinates
         attrs=raster.attrs  # Preserve the original attributes
     )
+    return quantized
+
+
+def invalid_mask(vals):
+    """Mask of missing data pixels: NaN for float rasters, the SNOW_NODATA sentinel for quantized ones"""
+    if np.issubdtype(vals.dtype, np.floating):
+        return np.isnan(vals)
+
+    return vals == SNOW_NODATA
+
+
+def reclassify_white_day(raster, snow_threshold):
+    """
+    Reclassify raster into no-snow (0) and white day (1) classes
+
+    Specialized 2-bin reclassification: a single vectorized comparison against
+    the threshold replaces the general-purpose binary search of np.digitize.
+    """
+    # For dask-backed rasters keep the classification lazy, applied chunk by chunk
+    if raster.chunks:
+        white = (raster >= snow_threshold).astype(np.float32)
+        return white.where(raster.notnull())
+
+    vals = raster.values
+
+    # Classify white days with a single comparison
+    white = (vals >= snow_threshold).astype(np.uint8)
+
+    # Retain missing data by ensuring it is not reclassified
+    white = np.where(invalid_mask(vals), np.nan, white).astype(np.float32)
+
+    # Reuse the raster's coords and attrs without rebuilding its indexes
+    return raster.copy(data=white)
+
+
+def _digitize_values(vals, bins):
+    """Digitize raw values into given bins, retaining NaN (pure ndarray kernel)"""
+    if numba is not None and len(bins) >= 4:
+        # keep float32/float64 values at their own precision and the bins float64,
+        # so edge comparisons promote exactly like np.searchsorted's
+        if vals.dtype not in (np.float32, np.float64):
+            vals = vals.astype(np.float32)
+
+        # Classify and mask NaN in a single parallel pass
+        return _digitize_numba(np.ascontiguousarray(vals),
+                               np.asarray(bins, dtype=np.float64))
+
+    # np.searchsorted matches np.digitize for increasing bins, without
+    # digitize's extra dtype promotion, and skips xarray dispatch
+    reclassified = np.searchsorted(bins, vals, side="right").astype(np.float32)
+
+    # Retain NaN values in-place by ensuring they are not reclassified
+    np.copyto(reclassified, np.nan, where=np.isnan(vals))
+
     return reclassified
 
 
+def reclassify_raster(raster, bins):
+    """Reclassify raster according to given bins"""
+
+    # For dask-backed rasters keep the reclassification lazy, applied chunk by chunk
+    if raster.chunks:
+        return xr.apply_ufunc(
+            _digitize_values,
+            raster,
+            kwargs={"bins": bins},
+            dask="parallelized",
+            output_dtypes=[np.float32]
+        )
+
+    # Reuse the raster's coords and attrs without rebuilding its indexes
+    return raster.copy(data=_digitize_values(raster.values, bins))
+
+
+def cube_threshold_sum(cube, snow_threshold):
+    """
+    Count per pixel how many year slices of the cube pass the snow threshold
+
+    Streams the stacked (years, ...) cube into preallocated accumulators, so no
+    cube-sized boolean temporary is ever materialized.
+
+    Args:
+        cube (ndarray): stacked snow depth values with years as the leading axis
+        snow_threshold: Snow depth threshold (in cm) for a pixel to count as white
+
+    Returns:
+        tuple[ndarray, ndarray]: int16 counts of passing years per pixel, and a
+            boolean mask of pixels missing data in any year
+    """
+    if numba is not None and np.issubdtype(cube.dtype, np.floating):
+        # numba fuses compare, count and NaN tracking into one parallel pass
+        counts = np.empty(cube.shape[1:], dtype=np.int16)
+        invalid = np.empty(cube.shape[1:], dtype=np.bool_)
+        _threshold_sum_numba(cube, snow_threshold, counts, invalid)
+        return counts, invalid
+
+    if numexpr is not None and np.issubdtype(cube.dtype, np.floating):
+        # numexpr streams the compare-and-sum in cache-sized blocks across threads,
+        # without materializing a cube-sized boolean (NaN fails the >= comparison,
+        # and `cube != cube` is the NaN test)
+        counts = numexpr.evaluate("sum(where(cube >= snow_threshold, 1, 0), axis=0)")
+        invalid = numexpr.evaluate("sum(where(cube != cube, 1, 0), axis=0)")
+        return counts.astype(np.int16), invalid > 0
+
+    counts = np.zeros(cube.shape[1:], dtype=np.int16)
+    invalid = np.zeros(cube.shape[1:], dtype=bool)
+
+    for year_slice in cube:
+        np.add(counts, year_slice >= snow_threshold, out=counts)
+        invalid |= invalid_mask(year_slice)
+
+    return counts, invalid
+
+
+def cube_all3_threshold_sum(cube, snow_threshold):
+    """
+    Count per pixel the years whose 3 Christmas days all pass the snow threshold
+
+    Args:
+        cube (ndarray): stacked snow depth values of shape (years, 3, y, x)
+        snow_threshold: Snow depth threshold (in cm) for a day to count as white
+
+    Returns:
+        tuple[ndarray, ndarray]: int16 counts of all-white years per pixel, and a
+            boolean mask of pixels missing data in any day of any year
+    """
+    if numba is not None and np.issubdtype(cube.dtype, np.floating):
+        # numba fuses the 3-day AND, year count and NaN tracking into one parallel pass
+        counts = np.empty(cube.shape[2:], dtype=np.int16)
+        invalid = np.empty(cube.shape[2:], dtype=np.bool_)
+        _all3_threshold_sum_numba(cube, snow_threshold, counts, invalid)
+        return counts, invalid
+
+    counts = np.zeros(cube.shape[2:], dtype=np.int16)
+    invalid = np.zeros(cube.shape[2:], dtype=bool)
+
+    for year_slab in cube:
+        np.add(counts, (year_slab >= snow_threshold).all(axis=0), out=counts)
+        invalid |= invalid_mask(year_slab).any(axis=0)
+
+    return counts, invalid
+
+
+# Colormap and colorbar layout for the white christmas probability maps, built
+# once at import so batch map generation does not re-parse the colors per plot
+_WXMAS_PROB_CMAP = plt.matplotlib.colors.ListedColormap(['yellow', 'lightblue', "tab:blue", 'darkslateblue', 'midnightblue'])
+_WXMAS_PROB_TICKS = [1.5, 2.5, 3.5, 4.5, 5.5]
+_WXMAS_PROB_LABELS = ['Only 5/10 white', '6-8 / 10 white', '8-9 / 10 white', 'White almost every year', 'Always White']
+
+
 def wxmas_prob_cmap():
     """
-    Create custom colormap for white christmas probability map
+    Custom colormap for white christmas probability map
 
     Inspired by the first map in this FMI statistic: https://en.ilmatieteenlaitos.fi/christmas-weather
     """
-    return plt.matplotlib.colors.ListedColormap(['yellow', 'lightblue', "tab:blue", 'darkslateblue', 'midnightblue'])
+    return _WXMAS_PROB_CMAP
+
+
+# Reprojected borders keyed by (id of the GeoDataFrame, target CRS); a strong
+# reference to each source GeoDataFrame is kept so ids stay valid
+_MAX_CACHED_BORDERS = 8
+_borders_cache = {}
+
+
+def _reproject_borders(borders, crs):
+    """Reproject borders vector data to given CRS, caching the result across plot calls"""
+    cache_key = (id(borders), str(crs))
+    cached = _borders_cache.get(cache_key)
+
+    if cached is not None and cached[0] is borders:
+        return cached[1]
+
+    reprojected = borders.to_crs(crs)
+
+    # keep the cache bounded, dropping the oldest entry
+    if len(_borders_cache) >= _MAX_CACHED_BORDERS:
+        _borders_cache.pop(next(iter(_borders_cache)))
+    _borders_cache[cache_key] = (borders, reprojected)
+
+    return reprojected
 
 
 def plot_borders(borders, raster, axs):
     """Plot borders vector data on given raster axes"""
-    borders = borders.to_crs(raster.rio.crs)
+    borders = _reproject_borders(borders, raster.rio.crs)
     for ax in axs:
         borders.plot(ax=ax, facecolor='none', linewidth=0.3)
 
@@ -71,6 +343,4 @@ def set_white_xmas_ticks(colorbar, snow_threshold):
 
 def set_wxmas_prob_ticks(cbar):
     """Set custom colorbar ticks for white christmas probability plot"""
-    ticks = [1.5,2.5,3.5,4.5,5.5]
-    labels = ['Only 5/10 white', '6-8 / 10 white', '8-9 / 10 white', 'White almost every year', 'Always White']
-    cbar.set_ticks(ticks, labels=labels)
\ No newline at end of file
+    cbar.set_ticks(_WXMAS_PROB_TICKS, labels=_WXMAS_PROB_LABELS)
\ No newline at end of file